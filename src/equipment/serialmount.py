@@ -1,7 +1,6 @@
-from abc import ABCMeta, abstractmethod, abstractproperty
+from abc import ABCMeta, abstractmethod
 from platform import system
 
-from astropy.coordinates import EarthLocation
 from serial import Serial
 from serial.serialutil import (
     FIVEBITS,
@@ -15,45 +14,132 @@ from serial.serialutil import (
     STOPBITS_TWO,
     STOPBITS_ONE_POINT_FIVE
 )
-from decimal import Decimal
+from functools import lru_cache
+from types import MappingProxyType
 
-from typing import Tuple, Dict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
 import re
+import sys
 
-unix_port_re = re.compile(r'/dev/[a-zA-Z0-9\-]+')
-win_port_re = re.compile(r'COM[1-9]')
+if TYPE_CHECKING:
+    from astropy.coordinates import EarthLocation
+
+unix_port_re = re.compile(r'/dev/\w[\w.:\-]*(?:/\w[\w.:\-]*)*')
+win_port_re = re.compile(r'COM[1-9][0-9]{0,2}')
+os_port_re_map = {
+    'Linux': unix_port_re,
+    'Darwin': unix_port_re,
+    'Windows': win_port_re
+}
+os_port_format_map = {
+    'Linux': '/dev/XXX',
+    'Darwin': '/dev/XXX',
+    'Windows': 'COM<n>'
+}
 required_serial_config_keys = ['port', 'baud_rate', 'data_bits', 'stop_bits', 'parity']
-parity_value_map = {
+required_serial_config_key_set = frozenset(required_serial_config_keys)
+# keys are lower case, parity values are normalized with str.lower() before lookup
+parity_value_map = MappingProxyType({
     'e': PARITY_EVEN,
-    'E': PARITY_EVEN,
     'even': PARITY_EVEN,
-    'Even': PARITY_EVEN,
     'n': PARITY_NONE,
-    'N': PARITY_NONE,
     'none': PARITY_NONE,
-    'None': PARITY_NONE,
     'o': PARITY_ODD,
-    'O': PARITY_ODD,
-    'odd': PARITY_ODD,
-    'Odd': PARITY_ODD
-}
-stop_bits_map = {
+    'odd': PARITY_ODD
+})
+stop_bits_map = MappingProxyType({
     1: STOPBITS_ONE,
     1.5: STOPBITS_ONE_POINT_FIVE,
     2: STOPBITS_TWO
-}
-data_bits_map = {
+})
+data_bits_map = MappingProxyType({
     5: FIVEBITS,
     6: SIXBITS,
     7: SEVENBITS,
     8: EIGHTBITS
+})
+valid_data_bits = frozenset(data_bits_map)
+parity_error_prefix = f'SerialMount serial parity must be one of [{",".join(parity_value_map)}] but was '
+stop_bits_error_prefix = f'SerialMount serial stop_bits must be an int one of [{",".join(str(x) for x in stop_bits_map)}] but was '
+
+
+def _is_int(value: Any) -> bool:
+    # bool is an int subclass but never a valid serial setting
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _validate_port(value: Any, os: str) -> Optional[str]:
+    port_re = os_port_re_map.get(os)
+    if port_re is not None and not port_re.fullmatch(value):
+        return f'SerialMount Serial Port wrong format, expected \'{os_port_format_map[os]}\' but was \'{value}\''
+    return None
+
+
+def _validate_baud_rate(value: Any, os: str) -> Optional[str]:
+    if not _is_int(value) or not 9600 <= value <= 230400:
+        return 'SerialMount serial baud_rate must be an int between 9600 and 203400 inclusive'
+    return None
+
+
+def _validate_data_bits(value: Any, os: str) -> Optional[str]:
+    if not _is_int(value) or value not in valid_data_bits:
+        return 'SerialMount serial data_bits must be an int between 5 and 8 inclusive'
+    return None
+
+
+def _validate_stop_bits(value: Any, os: str) -> Optional[str]:
+    if value not in stop_bits_map:
+        return f'{stop_bits_error_prefix}\'{value}\''
+    return None
+
+
+def _validate_parity(value: Any, os: str) -> Optional[str]:
+    if not isinstance(value, str) or value.lower() not in parity_value_map:
+        return f'{parity_error_prefix}\'{value}\''
+    return None
+
+
+serial_validators: Dict[str, Callable[[Any, str], Optional[str]]] = {
+    'port': _validate_port,
+    'baud_rate': _validate_baud_rate,
+    'data_bits': _validate_data_bits,
+    'stop_bits': _validate_stop_bits,
+    'parity': _validate_parity
 }
 
+_missing = object()
+
+
+def _validate_serial_values_uncached(os: str, *values: Any) -> Tuple[str, ...]:
+    errors = []
+    for key, value in zip(required_serial_config_keys, values):
+        # missing keys are reported by the caller
+        if value is _missing:
+            continue
+
+        error = serial_validators[key](value, os)
+        if error is not None:
+            errors.append(error)
+
+    return tuple(errors)
+
+
+_validate_serial_values = lru_cache(maxsize=128, typed=True)(_validate_serial_values_uncached)
+
+
+def _serial_value_errors(os: str, values: Tuple[Any, ...]) -> Tuple[str, ...]:
+    try:
+        return _validate_serial_values(os, *values)
+    except TypeError:
+        # unhashable values can't be cached, validate them directly
+        # (a TypeError from a validator itself is raised again here)
+        return _validate_serial_values_uncached(os, *values)
+
 
 class SerialMount(metaclass=ABCMeta):
     _port: Serial = None
-    _position: EarthLocation = EarthLocation(0, 0, 0)
+    _position: Optional['EarthLocation'] = None
     _config: dict = None
     _polar_aligned: bool = False
 
@@ -65,8 +151,7 @@ class SerialMount(metaclass=ABCMeta):
             if valid:
                 SerialMount.apply_config_to_serial_port(config, self._port)
             else:
-                for msg in errors:
-                    print(msg)
+                sys.stderr.write('\n'.join(errors) + '\n')
         else:
             self._port = serial_port
 
@@ -84,62 +169,39 @@ class SerialMount(metaclass=ABCMeta):
 
     @property
     @abstractmethod
-    def position(self) -> EarthLocation:
-        pass
+    def position(self) -> 'EarthLocation':
+        # astropy is slow to import, only load it once a position is needed
+        if self._position is None:
+            from astropy.coordinates import EarthLocation
+            self._position = EarthLocation(0, 0, 0)
+        return self._position
 
     def connect(self) -> None:
         self._port.open()
 
     @staticmethod
     def apply_config_to_serial_port(config: Dict, port: Serial) -> None:
-        port.port = config['serial']['port']
-        port.baudrate = config['serial']['baud_rate']
-        port.bytesize = config['serial']['data_bits']
-        port.stopbits = stop_bits_map[config['serial']['stop_bits']]
-        port.parity = parity_value_map[config['serial']['parity']]
+        serial_config = config['serial']
+        port.port = serial_config['port']
+        port.baudrate = serial_config['baud_rate']
+        port.bytesize = serial_config['data_bits']
+        port.stopbits = stop_bits_map[serial_config['stop_bits']]
+        port.parity = parity_value_map[serial_config['parity'].lower()]
 
     @staticmethod
     def validate_config(config: Dict) -> Tuple[bool, list]:
-        has_error = False
-        errors = []
-
         # validate serial port settings
         serial_config = config['serial']
-        for key in required_serial_config_keys:
-            if key not in serial_config:
-                has_error = True
-                errors.append(f'Key: {key} missing from mount serial config')
-                continue
-
-            os = system()
-            value = serial_config[key]
-            value_type = type(value)
-
-            if key == 'port':
-                if (os == 'Linux' or os == 'Darwin') and not re.match(unix_port_re, value):
-                    has_error = True
-                    errors.append(f'SerialMount Serial Port wrong format, expected \'/dev/XXX\' but was \'{value}\'')
-                elif os == 'Windows' and not re.match(win_port_re, value):  # os == 'Windows'
-                    has_error = True
-                    errors.append(f'SerialMount Serial Port wrong format, expected \'COM<n>\' but was \'{value}\'')
-
-            if key == 'baud_rate' and (value_type is not int or value < 9600 or value > 230400):
-                has_error = True
-                errors.append('SerialMount serial baud_rate must be an int between 9600 and 203400 inclusive')
-
-            if key == 'data_bits' and (value_type is not int or value not in data_bits_map.keys()):
-                has_error = True
-                errors.append('SerialMount serial data_bits must be an int between 5 and 8 inclusive')
-
-            if key == 'parity' and (value_type is not str or value not in parity_value_map.keys()):
-                has_error = True
-                errors.append(f'SerialMount serial parity must be one of [{",".join(parity_value_map.keys())}] but was \'{value}\'')
-
-            if key == 'stop_bits' and value not in stop_bits_map.keys():
-                has_error = True
-                errors.append(f'SerialMount serial stop_bits must be an int one of [{",".join([str(x) for x in stop_bits_map.keys()])}] but was \'{value}\'')
-
-        return not has_error, errors
+        errors = []
+        missing = required_serial_config_key_set.difference(serial_config)
+        if missing:
+            errors.extend(f'Key: {key} missing from mount serial config'
+                          for key in required_serial_config_keys if key in missing)
+
+        values = tuple(serial_config.get(key, _missing) for key in required_serial_config_keys)
+        errors.extend(_serial_value_errors(system(), values))
+
+        return not errors, errors
 
 
 class IoptronMount(SerialMount):
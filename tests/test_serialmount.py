@@ -1,7 +1,7 @@
 from astropy.coordinates import EarthLocation
 import pytest
 from platform import system
-from serial import Serial, PARITY_NONE, STOPBITS_ONE, EIGHTBITS
+from serial import Serial, PARITY_EVEN, PARITY_NONE, PARITY_ODD, STOPBITS_ONE, EIGHTBITS
 from typing import Dict
 
 from src.equipment.serialmount import SerialMount, parity_value_map, required_serial_config_keys
@@ -20,6 +20,14 @@ class TestSerialMount(SerialMount):
         return self._position
 
 
+class DefaultPositionMount(SerialMount):
+    __test__ = False
+
+    @property
+    def position(self):
+        return super().position
+
+
 def valid_config() -> Dict:
     return {
         'serial': {
@@ -38,6 +46,47 @@ def test_mount_not_connected_after_init():
     assert not mount.connected
 
 
+def test_mount_default_position_is_created_lazily():
+    mount = DefaultPositionMount(config={}, serial_port=Serial())
+
+    position = mount.position
+
+    assert isinstance(position, EarthLocation)
+    assert position.lon.value == position.lat.value == position.height.value == 0
+    assert mount.position is position
+
+
+def test_mount_position_from_subclass_class_attribute():
+    mount = TestSerialMount(config={}, serial_port=Serial())
+
+    assert mount.position is TestSerialMount._position
+
+
+def test_mount_polar_aligned_defaults_to_false():
+    mount = TestSerialMount(config={}, serial_port=Serial())
+
+    assert not mount.polar_aligned
+
+    mount.polar_aligned = True
+
+    assert mount.polar_aligned
+
+
+def test_mount_init_reports_invalid_config_on_stderr(capsys):
+    config = valid_config()
+    config['serial']['baud_rate'] = 0
+    del config['serial']['parity']
+
+    TestSerialMount(config=config)
+
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert captured.err == (
+        'Key: parity missing from mount serial config\n'
+        'SerialMount serial baud_rate must be an int between 9600 and 203400 inclusive\n'
+    )
+
+
 def test_mount_connected_from_serial_port_is_open():
     port = Serial()
     port.open = Mock()
@@ -76,9 +125,23 @@ def test_validate_config_missing_required_serial_values(serial_key):
         ('Linux', '/dev/test', True, None),
         ('Darwin', '/dev/test', True, None),
         ('Windows', 'COM1', True, None),
+        ('Windows', 'COM10', True, None),
+        ('Windows', 'COM256', True, None),
+        ('Linux', '/dev/ttyUSB0', True, None),
+        ('Linux', '/dev/serial/by-id/usb-FTDI_FT232R-if00-port0', True, None),
+        ('Linux', '/dev/serial/by-path/pci-0000:00:14.0-usb-0:1:1.0-port0', True, None),
+        ('Darwin', '/dev/cu.usbserial-1420', True, None),
         ('Linux', 'COM1', False, 'SerialMount Serial Port wrong format, expected \'/dev/XXX\' but was \'COM1\''),
         ('Darwin', 'COM1', False, 'SerialMount Serial Port wrong format, expected \'/dev/XXX\' but was \'COM1\''),
         ('Windows', '/dev/test', False, 'SerialMount Serial Port wrong format, expected \'COM<n>\' but was \'/dev/test\''),
+        ('Windows', 'COM0', False, 'SerialMount Serial Port wrong format, expected \'COM<n>\' but was \'COM0\''),
+        ('Windows', 'COM1 ', False, 'SerialMount Serial Port wrong format, expected \'COM<n>\' but was \'COM1 \''),
+        ('Linux', '/dev/ttyUSB0 junk', False, 'SerialMount Serial Port wrong format, expected \'/dev/XXX\' but was \'/dev/ttyUSB0 junk\''),
+        ('Linux', '/dev/', False, 'SerialMount Serial Port wrong format, expected \'/dev/XXX\' but was \'/dev/\''),
+        ('Linux', '/dev/..', False, 'SerialMount Serial Port wrong format, expected \'/dev/XXX\' but was \'/dev/..\''),
+        ('Linux', '/dev/./x', False, 'SerialMount Serial Port wrong format, expected \'/dev/XXX\' but was \'/dev/./x\''),
+        ('Linux', '/dev/../etc/passwd', False, 'SerialMount Serial Port wrong format, expected \'/dev/XXX\' but was \'/dev/../etc/passwd\''),
+        ('Darwin', '/dev/serial/../tty', False, 'SerialMount Serial Port wrong format, expected \'/dev/XXX\' but was \'/dev/serial/../tty\''),
     ])
 @patch('src.equipment.serialmount.system')
 def test_validate_config_serial_port_valid(system, os, port, expected_valid, message):
@@ -120,6 +183,32 @@ def test_validate_config_baud_rate_is_integer_in_valid_range(baud_rate, expected
         assert len(errors) == 0
 
 
+def test_validate_config_accepts_int_subclasses():
+    class SerialSetting(int):
+        pass
+
+    config = valid_config()
+    config['serial']['baud_rate'] = SerialSetting(115200)
+    config['serial']['data_bits'] = SerialSetting(8)
+
+    is_valid, errors = SerialMount.validate_config(config)
+
+    assert is_valid
+    assert len(errors) == 0
+
+
+def test_validate_config_does_not_conflate_equal_values_of_different_types():
+    config = valid_config()
+    config['serial']['baud_rate'] = 9600
+    SerialMount.validate_config(config)
+    config['serial']['baud_rate'] = 9600.0
+
+    is_valid, errors = SerialMount.validate_config(config)
+
+    assert not is_valid
+    assert 'SerialMount serial baud_rate must be an int between 9600 and 203400 inclusive' in errors
+
+
 @pytest.mark.parametrize('data_bits,expected_valid', [
     (10000.0, False),
     (False, False),
@@ -161,10 +250,15 @@ def test_validate_config_parity_invalid_values(parity):
 
     assert not valid
     assert len(errors) == 1
-    assert f'SerialMount serial parity must be one of [e,E,even,Even,n,N,none,None,o,O,odd,Odd] but was \'{parity}\'' in errors
+    assert f'SerialMount serial parity must be one of [e,even,n,none,o,odd] but was \'{parity}\'' in errors
 
 
-@pytest.mark.parametrize('parity', parity_value_map.keys())
+@pytest.mark.parametrize('parity', [
+    *parity_value_map.keys(),
+    'E', 'Even', 'EVEN',
+    'N', 'None', 'NONE',
+    'O', 'Odd', 'ODD'
+])
 def test_validate_config_parity_valid_values(parity):
     config = valid_config()
     config['serial']['parity'] = parity
@@ -208,3 +302,19 @@ def test_serial_port_apply_config():
     assert port.bytesize == EIGHTBITS
     assert port.parity == PARITY_NONE
     assert port.stopbits == STOPBITS_ONE
+
+
+@pytest.mark.parametrize('parity,expected', [
+    ('e', PARITY_EVEN),
+    ('Even', PARITY_EVEN),
+    ('N', PARITY_NONE),
+    ('ODD', PARITY_ODD),
+])
+def test_serial_port_apply_config_parity_is_case_insensitive(parity, expected):
+    config = valid_config()
+    config['serial']['parity'] = parity
+    port = Serial()
+
+    SerialMount.apply_config_to_serial_port(config, port)
+
+    assert port.parity == expected